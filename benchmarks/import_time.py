@@ -0,0 +1,85 @@
+"""
+Cold-start benchmark for the monitor, dashboard and chatbot dependencies.
+
+Each module is imported in a fresh interpreter so nothing is cached between runs.
+Importing dashboard/chatbot outside "streamlit run" only executes their
+module-level code (imports and page setup), which is the cold-start cost.
+
+Usage (from the repository root):
+    python benchmarks/import_time.py [--runs 5] [--fetch]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry points first, then the individual components
+MODULES = [
+    "dashboard",
+    "chatbot",
+    "src.cli",
+    "src.monitor",
+    "src.news_aggregator",
+    "src.ollama_analyzer",
+    "src.price_tracker",
+    "src.anomaly_detector",
+]
+
+IMPORT_SNIPPET = """
+import time
+t0 = time.perf_counter()
+import {module}
+print(time.perf_counter() - t0)
+"""
+
+# Monitor start-up to the first live price (needs network access)
+FETCH_SNIPPET = """
+import time
+t0 = time.perf_counter()
+from src.monitor import OilPriceMonitor
+OilPriceMonitor().price_tracker.fetch_live_price()
+print(time.perf_counter() - t0)
+"""
+
+
+def _time_snippet(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _report(label, code, runs):
+    try:
+        timings = [_time_snippet(code) for _ in range(runs)]
+    except RuntimeError as e:
+        print(f"{label:<28} failed: {e}")
+        return
+    print(
+        f"{label:<28} min {min(timings) * 1000:8.1f} ms   "
+        f"median {statistics.median(timings) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--fetch", action="store_true", help="Also time the first live price fetch")
+    args = parser.parse_args()
+
+    for module in MODULES:
+        _report(f"import {module}", IMPORT_SNIPPET.format(module=module), args.runs)
+    if args.fetch:
+        _report("first price fetch", FETCH_SNIPPET, args.runs)
+
+
+if __name__ == "__main__":
+    main()
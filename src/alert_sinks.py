@@ -0,0 +1,94 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class AlertSink:
+    """Base class for anomaly episode alert destinations"""
+
+    def send(self, event, episode):
+        raise NotImplementedError
+
+
+class LogAlertSink(AlertSink):
+    """Local stand-in sink that writes alerts to the application log"""
+
+    def send(self, event, episode):
+        logger.warning(
+            f"ALERT [{event}] episode {episode.id}: "
+            f"peak ${episode.peak_price:.2f} (Z={episode.peak_z:.2f}), "
+            f"{episode.tick_count} ticks"
+        )
+
+
+class FileAlertSink(AlertSink):
+    """Appends one JSON line per alert to a file"""
+
+    def __init__(self, path="data/alerts.jsonl"):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def send(self, event, episode):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({'event': event, **episode.to_dict()}) + "\n")
+
+
+class WebhookAlertSink(AlertSink):
+    """POSTs alerts as JSON to a webhook URL"""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, event, episode):
+        import requests
+        
+        response = requests.post(
+            self.url,
+            json={'event': event, 'episode': episode.to_dict()},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+
+class AlertDispatcher:
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks) if sinks else [LogAlertSink()]
+
+    def dispatch(self, event, episode):
+        """Send an alert to every sink; one failing sink does not block the others"""
+        for sink in self.sinks:
+            try:
+                sink.send(event, episode)
+            except Exception as e:
+                logger.error(f"Alert sink {type(sink).__name__} failed: {e}")
+
+
+def build_alert_sinks(spec=None):
+    """
+    Build sinks from a comma separated spec (default: ALERT_SINKS env var)
+
+    Supported names: log, file (ALERT_FILE), webhook (ALERT_WEBHOOK_URL)
+    """
+    spec = spec if spec is not None else os.getenv('ALERT_SINKS', 'log')
+    sinks = []
+    for name in (s.strip().lower() for s in spec.split(',')):
+        if not name:
+            continue
+        if name == 'log':
+            sinks.append(LogAlertSink())
+        elif name == 'file':
+            sinks.append(FileAlertSink(os.getenv('ALERT_FILE', 'data/alerts.jsonl')))
+        elif name == 'webhook':
+            url = os.getenv('ALERT_WEBHOOK_URL')
+            if url:
+                sinks.append(WebhookAlertSink(url))
+            else:
+                logger.warning("Webhook alert sink requested but ALERT_WEBHOOK_URL is not set")
+        else:
+            logger.warning(f"Unknown alert sink '{name}' ignored")
+    return sinks
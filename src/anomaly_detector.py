@@ -1,5 +1,8 @@
-import numpy as np
 from collections import deque
+import logging
+from statistics import fmean, pstdev
+
+logger = logging.getLogger(__name__)
 
 class AnomalyDetector:
     def __init__(self, window_size=10, threshold=3):
@@ -20,9 +23,13 @@ class AnomalyDetector:
             return False, 0.0
             
         prices = list(self.price_window)
-        mean = np.mean(prices[:-1])
-        std = np.std(prices[:-1])
+        mean = fmean(prices[:-1])
+        std = pstdev(prices[:-1], mu=mean)
         z_score = (prices[-1] - mean) / std if std != 0 else 0.0
         
-        print(f"DEBUG: Price={prices[-1]}, Mean={mean:.2f}, STD={std:.2f}, Z={z_score:.2f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Price={prices[-1]}, Mean={mean:.2f}, STD={std:.2f}, Z={z_score:.2f}",
+                extra={'price': prices[-1], 'mean': mean, 'std': std, 'z_score': z_score}
+            )
         return abs(z_score) > self.threshold, z_score
\ No newline at end of file
@@ -0,0 +1,131 @@
+from datetime import timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+EPISODE_STARTED = "started"
+EPISODE_UPDATED = "updated"
+EPISODE_ENDED = "ended"
+
+
+class AnomalyEpisode:
+    def __init__(self, started_at, price, z_score):
+        """
+        One price anomaly event spanning consecutive anomalous ticks
+
+        Parameters:
+        - started_at: Timestamp of the first anomalous tick
+        - price: Price at the first anomalous tick
+        - z_score: Z-score at the first anomalous tick
+        """
+        self.id = None  # Assigned by ETLPipeline.store_episode
+        self.started_at = started_at
+        self.ended_at = None
+        self.peak_price = price
+        self.peak_z = z_score
+        self.last_price = price
+        self.tick_count = 1
+        self.analysis = None
+
+    @property
+    def is_open(self):
+        return self.ended_at is None
+
+    def update(self, price, z_score):
+        """Record another anomalous tick, tracking the strongest deviation"""
+        self.tick_count += 1
+        self.last_price = price
+        if abs(z_score) > abs(self.peak_z):
+            self.peak_z = z_score
+            self.peak_price = price
+
+    def close(self, ended_at):
+        self.ended_at = ended_at
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'started_at': str(self.started_at),
+            'ended_at': str(self.ended_at) if self.ended_at else None,
+            'peak_price': float(self.peak_price),
+            'peak_z': float(self.peak_z),
+            'last_price': float(self.last_price),
+            'tick_count': self.tick_count,
+            'analysis': self.analysis
+        }
+
+
+class AnomalyEventTracker:
+    def __init__(self, cooldown_minutes=30, quiet_ticks=1):
+        """
+        State machine grouping consecutive anomalous ticks into episodes
+
+        Parameters:
+        - cooldown_minutes: Minimum time between two news enrichments
+        - quiet_ticks: Normal ticks required before an episode is closed
+        """
+        self.cooldown = timedelta(minutes=cooldown_minutes)
+        self.quiet_ticks = max(1, quiet_ticks)
+        self.current_episode = None
+        self.last_enriched_at = None
+        self.quiet_count = 0
+
+    def observe(self, timestamp, price, is_anomaly, z_score):
+        """
+        Feed one detector result into the state machine
+
+        Returns (event, episode) where event is EPISODE_STARTED,
+        EPISODE_UPDATED, EPISODE_ENDED or None when nothing changed.
+        """
+        episode = self.current_episode
+
+        if is_anomaly:
+            self.quiet_count = 0
+            if episode is None:
+                self.current_episode = AnomalyEpisode(timestamp, price, z_score)
+                logger.warning(
+                    f"Anomaly episode started at {timestamp} "
+                    f"(price ${price:.2f}, Z={z_score:.2f})"
+                )
+                return EPISODE_STARTED, self.current_episode
+            episode.update(price, z_score)
+            return EPISODE_UPDATED, episode
+
+        if episode is None:
+            return None, None
+
+        # Debounce: a single normal tick inside a noisy episode does not end it
+        self.quiet_count += 1
+        if self.quiet_count < self.quiet_ticks:
+            return None, episode
+
+        episode.close(timestamp)
+        self.current_episode = None
+        self.quiet_count = 0
+        logger.info(
+            f"Anomaly episode ended at {timestamp} after {episode.tick_count} ticks "
+            f"(peak Z={episode.peak_z:.2f})"
+        )
+        return EPISODE_ENDED, episode
+
+    def should_enrich(self, timestamp):
+        """True if the open episode still needs news analysis and the cooldown has passed"""
+        episode = self.current_episode
+        if episode is None or episode.analysis is not None:
+            return False
+        if self.last_enriched_at is None:
+            return True
+        return timestamp - self.last_enriched_at >= self.cooldown
+
+    def mark_enriched(self, timestamp, analysis):
+        """
+        Record an enrichment attempt; returns True if the analysis was kept
+
+        Only successful analyses (with 'reasons') are attached to the episode.
+        A failed one just starts the cooldown so the retry waits for it.
+        """
+        self.last_enriched_at = timestamp
+        if self.current_episode is None or not analysis or 'reasons' not in analysis:
+            return False
+        self.current_episode.analysis = analysis
+        return True
@@ -0,0 +1,201 @@
+"""
+Compact binary checkpoints of the monitor's in-memory state.
+
+Layout (little endian, version 1):
+    header      4s magic, B version
+    detector    I window_size, I n, n * d prices
+    tracker     str last_source, I n, n * (d timestamp, d price, str source)
+    episode     B present, then q id, d started_at, d peak_price, d peak_z,
+                d last_price, I tick_count, str analysis (JSON)
+    events      I quiet_count, d last_enriched_at (NaN if never)
+
+Strings are stored as I length + UTF-8 bytes, timestamps (naive local time)
+as POSIX seconds.
+"""
+from datetime import datetime
+import json
+import logging
+import math
+import os
+import struct
+
+from src.anomaly_events import AnomalyEpisode
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OPMC"
+VERSION = 1
+HISTORY_ROWS = 500  # Price tracker rows kept in a checkpoint
+
+
+class CheckpointError(Exception):
+    pass
+
+
+class _Writer:
+    def __init__(self):
+        self.parts = []
+
+    def pack(self, fmt, *values):
+        self.parts.append(struct.pack("<" + fmt, *values))
+
+    def string(self, value):
+        data = (value or "").encode("utf-8")
+        self.pack("I", len(data))
+        self.parts.append(data)
+
+    def getvalue(self):
+        return b"".join(self.parts)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, fmt):
+        fmt = "<" + fmt
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def string(self):
+        (length,) = self.unpack("I")
+        if self.offset + length > len(self.data):
+            raise CheckpointError("Truncated checkpoint")
+        value = self.data[self.offset:self.offset + length].decode("utf-8")
+        self.offset += length
+        return value
+
+
+def _to_epoch(value):
+    """Encode a naive local datetime (or pd.Timestamp) as POSIX seconds"""
+    if value is None:
+        return math.nan
+    # pd.Timestamp.timestamp() reads naive values as UTC while
+    # datetime.fromtimestamp() decodes to local time; convert first so a
+    # save/restore round trip does not shift timestamps by the UTC offset
+    if hasattr(value, 'to_pydatetime'):
+        value = value.to_pydatetime()
+    return value.timestamp()
+
+
+def _from_epoch(value):
+    return None if math.isnan(value) else datetime.fromtimestamp(value)
+
+
+def encode_state(monitor):
+    """Serialize detector, price tracker and episode state of a monitor"""
+    w = _Writer()
+    w.pack("4sB", MAGIC, VERSION)
+
+    detector = monitor.anomaly_detector
+    prices = [float(p) for p in detector.price_window]
+    w.pack("II", detector.window_size, len(prices))
+    w.pack(f"{len(prices)}d", *prices)
+
+    tracker = monitor.price_tracker
+    rows = tracker.historical_data.tail(HISTORY_ROWS).itertuples(index=False)
+    rows = list(rows)
+    w.string(tracker.last_source)
+    w.pack("I", len(rows))
+    for row in rows:
+        w.pack("dd", _to_epoch(row.timestamp), float(row.price))
+        w.string(row.source)
+
+    events = monitor.event_tracker
+    episode = events.current_episode
+    w.pack("B", episode is not None)
+    if episode is not None:
+        w.pack(
+            "qddddI",
+            episode.id if episode.id is not None else -1,
+            _to_epoch(episode.started_at),
+            float(episode.peak_price),
+            float(episode.peak_z),
+            float(episode.last_price),
+            episode.tick_count
+        )
+        w.string(json.dumps(episode.analysis) if episode.analysis is not None else "")
+    w.pack("Id", events.quiet_count, _to_epoch(events.last_enriched_at))
+
+    return w.getvalue()
+
+
+def decode_state(data, monitor):
+    """Restore state produced by encode_state into a freshly built monitor"""
+    # Parse everything first so a corrupt file leaves the monitor untouched
+    r = _Reader(data)
+    try:
+        magic, version = r.unpack("4sB")
+        if magic != MAGIC or version != VERSION:
+            raise CheckpointError(f"Unsupported checkpoint format {magic!r} v{version}")
+
+        _, count = r.unpack("II")
+        prices = r.unpack(f"{count}d")
+
+        last_source = r.string()
+        (count,) = r.unpack("I")
+        rows = []
+        for _ in range(count):
+            timestamp, price = r.unpack("dd")
+            rows.append({
+                'timestamp': _from_epoch(timestamp),
+                'price': price,
+                'source': r.string()
+            })
+
+        episode = None
+        (has_episode,) = r.unpack("B")
+        if has_episode:
+            episode_id, started_at, peak_price, peak_z, last_price, tick_count = r.unpack("qddddI")
+            analysis = r.string()
+            episode = AnomalyEpisode(_from_epoch(started_at), peak_price, peak_z)
+            episode.id = episode_id if episode_id >= 0 else None
+            episode.last_price = last_price
+            episode.tick_count = tick_count
+            episode.analysis = json.loads(analysis) if analysis else None
+        quiet_count, last_enriched_at = r.unpack("Id")
+        last_enriched_at = _from_epoch(last_enriched_at)
+    except (struct.error, UnicodeDecodeError, ValueError, OverflowError, OSError) as e:
+        # fromtimestamp raises OverflowError/OSError for out-of-range values
+        raise CheckpointError(f"Corrupt checkpoint: {e}") from e
+
+    tracker = monitor.price_tracker
+    if rows:
+        import pandas as pd
+
+        tracker.historical_data = pd.DataFrame(rows, columns=['timestamp', 'price', 'source'])
+    tracker.last_source = last_source
+
+    # The configured window size wins; deque(maxlen) keeps the newest prices
+    monitor.anomaly_detector.price_window.extend(prices)
+
+    events = monitor.event_tracker
+    events.current_episode = episode
+    events.quiet_count = quiet_count
+    events.last_enriched_at = last_enriched_at
+
+
+def save_checkpoint(path, monitor):
+    """Atomically write the monitor state to path"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encode_state(monitor))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, monitor):
+    """Restore monitor state from path; returns False if there is nothing usable"""
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, "rb") as f:
+            decode_state(f.read(), monitor)
+    except (OSError, CheckpointError) as e:
+        logger.warning(f"Ignoring checkpoint {path}: {e}")
+        return False
+    return True
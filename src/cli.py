@@ -0,0 +1,85 @@
+"""
+Command line entry point for the oil price monitor.
+
+    python -m src run [--interval 5]        Monitor forever
+    python -m src once                      Run one cycle (for cron/schedulers)
+    python -m src backfill [--period 5d]    Warm the detector from price history
+    python -m src rescore                   Recompute stored anomaly flags
+
+State is checkpointed to CHECKPOINT_PATH (default data/monitor_state.bin)
+after every cycle and restored at startup.
+"""
+import argparse
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser():
+    checkpoint_help = "Checkpoint file (default: CHECKPOINT_PATH or data/monitor_state.bin)"
+    parser = argparse.ArgumentParser(prog="python -m src", description="Oil price monitor")
+    parser.add_argument("--checkpoint", default=None, help=checkpoint_help)
+
+    # Also accepted after the subcommand; SUPPRESS keeps a value given before it
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--checkpoint", default=argparse.SUPPRESS, help=checkpoint_help)
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", parents=[common], help="Monitor continuously")
+    run.add_argument(
+        "--interval",
+        type=float,
+        default=float(os.getenv('POLLING_INTERVAL', 5)),
+        help="Minutes between checks"
+    )
+
+    subparsers.add_parser("once", parents=[common], help="Run a single monitoring cycle and exit")
+
+    backfill = subparsers.add_parser(
+        "backfill", parents=[common], help="Seed state and database from price history"
+    )
+    backfill.add_argument("--period", default="5d", help="yfinance history period")
+    backfill.add_argument("--interval", default="5m", help="yfinance bar interval")
+
+    subparsers.add_parser(
+        "rescore", parents=[common], help="Recompute stored anomaly flags with current settings"
+    )
+    return parser
+
+
+def main(argv=None):
+    from utils.config import load_env
+
+    load_env()  # So .env values apply to argument defaults
+    args = build_parser().parse_args(argv)
+
+    from src.monitor import OilPriceMonitor
+    from utils.logger import setup_logging
+
+    setup_logging()
+    try:
+        logger.info("=== OIL PRICE MONITOR STARTING ===")
+        monitor = OilPriceMonitor(checkpoint_path=args.checkpoint)
+        
+        if args.command == "run":
+            monitor.run(interval_minutes=args.interval)
+        elif args.command == "once":
+            return 0 if monitor.once() else 1
+        elif args.command == "backfill":
+            monitor.backfill(period=args.period, interval=args.interval)
+        elif args.command == "rescore":
+            monitor.rescore()
+        return 0
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped by user")
+        return 0
+    except Exception as e:
+        logger.critical(f"Fatal system error: {e}", exc_info=True)
+        raise
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,15 @@
 import sqlite3
+import json
 import logging
 import os
+from datetime import datetime
 
 class ETLPipeline:
     def __init__(self):
         os.makedirs("data", exist_ok=True)  # Ensure data directory exists
         self.db_file = "data/oil_prices.db"
+        self.logger = logging.getLogger(__name__)  # Used by _init_db's migration
         self._init_db()
-        self.logger = logging.getLogger(__name__)
         
     def _init_db(self):
         """Initialize database with schema migration support"""
@@ -36,6 +38,18 @@ class ETLPipeline:
             except Exception as e:
                 self.logger.error(f"Failed to add source column: {e}")
         
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS anomaly_episodes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT,
+                ended_at TEXT,
+                peak_price REAL,
+                peak_z REAL,
+                tick_count INTEGER,
+                analysis TEXT
+            )
+        """)
+        
         conn.commit()
         conn.close()
         
@@ -77,4 +91,122 @@ class ETLPipeline:
         except Exception as e:
             self.logger.error(f"Error storing data: {e}")
         finally:
-            conn.close()
\ No newline at end of file
+            conn.close()
+
+    def store_batch(self, records):
+        """Insert many (price_data, is_anomaly) records in one transaction"""
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_file)
+            conn.executemany("""
+                INSERT INTO oil_prices
+                (timestamp, price, is_anomaly, analysis, source)
+                VALUES (?, ?, ?, NULL, ?)
+            """, [
+                (
+                    str(price_data['timestamp']),
+                    price_data['price'],
+                    int(is_anomaly),
+                    price_data.get('source', 'unknown')
+                )
+                for price_data, is_anomaly in records
+            ])
+            conn.commit()
+            self.logger.info(f"Stored {len(records)} records")
+        except Exception as e:
+            self.logger.error(f"Error storing batch: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def latest_timestamp(self):
+        """Timestamp of the newest stored price, or None"""
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(timestamp) FROM oil_prices")
+            value = cursor.fetchone()[0]
+            return datetime.fromisoformat(value) if value else None
+        except Exception as e:
+            self.logger.error(f"Error reading latest timestamp: {e}")
+            return None
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def fetch_prices(self):
+        """Return (id, timestamp, price, is_anomaly) rows in chronological order"""
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, timestamp, price, is_anomaly
+                FROM oil_prices
+                WHERE price IS NOT NULL
+                ORDER BY timestamp, id
+            """)
+            return cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"Error reading prices: {e}")
+            return []
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def update_anomaly_flags(self, flags):
+        """Bulk update is_anomaly from (is_anomaly, id) pairs"""
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_file)
+            conn.executemany(
+                "UPDATE oil_prices SET is_anomaly = ? WHERE id = ?",
+                [(int(is_anomaly), row_id) for is_anomaly, row_id in flags]
+            )
+            conn.commit()
+            self.logger.info(f"Updated anomaly flags for {len(flags)} rows")
+        except Exception as e:
+            self.logger.error(f"Error updating anomaly flags: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def store_episode(self, episode):
+        """Insert a new anomaly episode or update an existing one; returns its id"""
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+            values = (
+                str(episode.started_at),
+                str(episode.ended_at) if episode.ended_at else None,
+                float(episode.peak_price),
+                float(episode.peak_z),
+                episode.tick_count,
+                json.dumps(episode.analysis) if episode.analysis else None
+            )
+            
+            if episode.id is None:
+                cursor.execute("""
+                    INSERT INTO anomaly_episodes
+                    (started_at, ended_at, peak_price, peak_z, tick_count, analysis)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, values)
+                episode.id = cursor.lastrowid
+            else:
+                cursor.execute("""
+                    UPDATE anomaly_episodes
+                    SET started_at = ?, ended_at = ?, peak_price = ?,
+                        peak_z = ?, tick_count = ?, analysis = ?
+                    WHERE id = ?
+                """, values + (episode.id,))
+            
+            conn.commit()
+            return episode.id
+        except Exception as e:
+            self.logger.error(f"Error storing anomaly episode: {e}")
+            return episode.id
+        finally:
+            if conn is not None:
+                conn.close()
@@ -1,31 +1,31 @@
 from datetime import datetime
+import json
 import logging
 import time
 import os
-from dotenv import load_dotenv
 
-from ollama_analyzer import OilPriceChangeAnalyzer
-from anomaly_detector import AnomalyDetector
-from etl_pipeline import ETLPipeline
-from news_aggregator import NewsAggregator
-from price_tracker import OilPriceTracker
+from utils.config import load_env
+from utils.logger import log_stage
+from src.ollama_analyzer import OilPriceChangeAnalyzer
+from src.anomaly_detector import AnomalyDetector
+from src.anomaly_events import AnomalyEventTracker, EPISODE_STARTED, EPISODE_ENDED
+from src.alert_sinks import AlertDispatcher, build_alert_sinks
+from src.checkpoint import load_checkpoint, save_checkpoint
+from src.etl_pipeline import ETLPipeline
+from src.news_aggregator import NewsAggregator
+from src.price_tracker import OilPriceTracker
 
-# Initialize logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('oil_monitor.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+
 class OilPriceMonitor:
-    def __init__(self):
+    def __init__(self, checkpoint_path=None):
         logger.info("Initializing Oil Price Monitoring System")
         try:
-            load_dotenv()
+            load_env()
+            self.checkpoint_path = checkpoint_path or os.getenv(
+                'CHECKPOINT_PATH', 'data/monitor_state.bin'
+            )
             
             # Initialize components
             self.price_tracker = OilPriceTracker()
@@ -36,6 +36,17 @@ class OilPriceMonitor:
             self.news_aggregator = NewsAggregator()
             self.analyzer = OilPriceChangeAnalyzer(model_name="mistral")
             self.etl = ETLPipeline()
+            self.event_tracker = AnomalyEventTracker(
+                cooldown_minutes=float(os.getenv('ENRICHMENT_COOLDOWN_MINUTES', 30)),
+                quiet_ticks=int(os.getenv('EPISODE_QUIET_TICKS', 2))
+            )
+            self.alerts = AlertDispatcher(build_alert_sinks())
+            
+            if load_checkpoint(self.checkpoint_path, self):
+                logger.info(
+                    f"Restored checkpoint {self.checkpoint_path} "
+                    f"({len(self.anomaly_detector.price_window)} prices in window)"
+                )
             
             logger.info("All system components initialized successfully")
         except Exception as e:
@@ -48,47 +59,9 @@ class OilPriceMonitor:
         
         while True:
             try:
-                # Price Monitoring
-                logger.info("Fetching latest oil price...")
-                price = self.price_tracker.fetch_live_price()
-                
-                if price is None:
-                    logger.warning("Price fetch failed. Using fallback methods...")
-                    price = self._get_fallback_price()
-                    if price is None:
-                        time.sleep(60)
-                        continue
-                
-                logger.info(f"Current Price: ${price:.2f}")
-                
-                # Anomaly Detection
-                is_anomaly, z_score = self.anomaly_detector.detect_anomaly(
-                    self.price_tracker.historical_data['price'].tolist()
-                )
-                
-                analysis = None
-                if is_anomaly:
-                    logger.warning(
-                        f"PRICE ANOMALY DETECTED! "
-                        f"Price: ${price:.2f}, Z-score: {z_score:.2f}"
-                    )
-                    
-                    # Enhanced News Analysis
-                    articles = self.news_aggregator.fetch_price_change_reasons()
-                    if articles:
-                        logger.info(f"Analyzing {len(articles)} relevant news articles")
-                        analysis = self.analyzer.analyze_price_change(articles)
-                        
-                        if 'reasons' in analysis:
-                            logger.info("Price Change Reasons Identified:")
-                            for reason in analysis['reasons']:
-                                logger.info(f"- {reason}")
-                self.etl.store_data({
-                    'timestamp': datetime.now(),
-                    'price': price,
-                    'source': self.price_tracker.last_source  # Now properly defined
-                }, is_anomaly, str(analysis) if analysis else None)
-                
+                if not self.run_cycle():
+                    time.sleep(60)
+                    continue
                 
                 logger.info(f"Next update in {interval_minutes} minutes...")
                 time.sleep(interval_minutes * 60)
@@ -97,6 +70,149 @@ class OilPriceMonitor:
                 logger.error(f"Monitoring cycle error: {e}", exc_info=True)
                 time.sleep(60)
 
+    def once(self):
+        """Run a single monitoring cycle; intended for cron/scheduler driven runs"""
+        return self.run_cycle()
+
+    def run_cycle(self):
+        """Fetch, score, enrich and store one price; returns False if no price was available"""
+        # Price Monitoring
+        logger.info("Fetching latest oil price...")
+        with log_stage(logger, "fetch") as fields:
+            price = self.price_tracker.fetch_live_price()
+            fields['symbol'] = self.price_tracker.last_symbol
+            fields['source'] = self.price_tracker.last_source
+        
+        if price is None:
+            logger.warning("Price fetch failed. Using fallback methods...")
+            price = self._get_fallback_price()
+            if price is None:
+                return False
+        
+        symbol = self.price_tracker.last_symbol
+        logger.info(
+            f"Current Price: ${price:.2f}",
+            extra={'symbol': symbol, 'price': float(price)}
+        )
+        
+        # Anomaly Detection
+        now = datetime.now()
+        with log_stage(logger, "detect", level=logging.DEBUG, symbol=symbol):
+            is_anomaly, z_score = self.anomaly_detector.detect_anomaly(price)
+            event, episode = self.event_tracker.observe(now, price, is_anomaly, z_score)
+        
+        analysis = None
+        if is_anomaly:
+            logger.warning(
+                f"PRICE ANOMALY DETECTED! "
+                f"Price: ${price:.2f}, Z-score: {z_score:.2f}",
+                extra={'symbol': symbol, 'price': float(price), 'z_score': float(z_score)}
+            )
+        
+        # Enrichment runs once per episode, subject to the cooldown
+        if self.event_tracker.should_enrich(now):
+            with log_stage(logger, "enrich", symbol=symbol):
+                result = self._analyze_news()
+            if self.event_tracker.mark_enriched(now, result):
+                analysis = result
+            else:
+                logger.warning("News analysis failed; retrying after the cooldown")
+        
+        with log_stage(logger, "store", level=logging.DEBUG, symbol=symbol):
+            # An enrichment on a debounce tick (no event) must still be persisted
+            if event is not None or analysis is not None:
+                self.etl.store_episode(episode)
+            if event in (EPISODE_STARTED, EPISODE_ENDED):
+                self.alerts.dispatch(event, episode)
+            
+            self.etl.store_data({
+                'timestamp': now,
+                'price': price,
+                'source': self.price_tracker.last_source  # Now properly defined
+            }, is_anomaly, json.dumps(analysis) if analysis else None)
+            
+            self.save_checkpoint()
+        return True
+
+    def backfill(self, period='5d', interval='5m'):
+        """Warm the detector from historical prices and store the ones not yet in the database"""
+        history = self.price_tracker.fetch_history(period=period, interval=interval)
+        
+        # Bars newer than the restored state feed the detector; the database
+        # cutoff only decides which of those still need to be stored
+        state_cutoff = None
+        if not self.price_tracker.historical_data.empty:
+            state_cutoff = self.price_tracker.historical_data['timestamp'].iloc[-1]
+        db_cutoff = self.etl.latest_timestamp()
+        
+        older = []
+        records = []
+        for timestamp, price, source in history:
+            if state_cutoff is not None and timestamp <= state_cutoff:
+                older.append(price)
+                continue
+            is_anomaly, _ = self.anomaly_detector.detect_anomaly(price)
+            self.price_tracker._store_price(price, source, timestamp)
+            self.price_tracker.last_source = source
+            if db_cutoff is None or timestamp > db_cutoff:
+                records.append(({'timestamp': timestamp, 'price': price, 'source': source}, is_anomaly))
+        
+        # Top up a partially restored window with the newest bars it predates
+        window = self.anomaly_detector.price_window
+        missing = self.anomaly_detector.window_size - len(window)
+        if missing > 0 and older:
+            window.extendleft(reversed(older[-missing:]))
+        
+        if records:
+            self.etl.store_batch(records)
+        logger.info(
+            f"Backfilled {len(records)} of {len(history)} historical prices "
+            f"({len(window)} in detector window)"
+        )
+        
+        self.save_checkpoint()
+        return len(records)
+
+    def rescore(self):
+        """Recompute stored anomaly flags with the current window size and threshold"""
+        detector = AnomalyDetector(
+            window_size=self.anomaly_detector.window_size,
+            threshold=self.anomaly_detector.threshold
+        )
+        rows = self.etl.fetch_prices()
+        
+        changed = []
+        for row_id, _, price, was_anomaly in rows:
+            is_anomaly, _ = detector.detect_anomaly(price)
+            if bool(is_anomaly) != bool(was_anomaly):
+                changed.append((is_anomaly, row_id))
+        
+        if changed:
+            self.etl.update_anomaly_flags(changed)
+        logger.info(f"Rescored {len(rows)} stored prices, {len(changed)} flags changed")
+        return len(rows), len(changed)
+
+    def save_checkpoint(self):
+        try:
+            save_checkpoint(self.checkpoint_path, self)
+        except Exception as e:
+            logger.error(f"Failed to write checkpoint {self.checkpoint_path}: {e}")
+
+    def _analyze_news(self):
+        """Fetch relevant news and run the LLM analysis for the current episode"""
+        articles = self.news_aggregator.fetch_price_change_reasons()
+        if not articles:
+            return None
+        
+        logger.info(f"Analyzing {len(articles)} relevant news articles")
+        analysis = self.analyzer.analyze_price_change(articles)
+        
+        if 'reasons' in analysis:
+            logger.info("Price Change Reasons Identified:")
+            for reason in analysis['reasons']:
+                logger.info(f"- {reason}")
+        return analysis
+
     def _get_fallback_price(self):
         """Attempt alternative price sources"""
         try:
@@ -109,12 +225,7 @@ class OilPriceMonitor:
             return None
 
 if __name__ == "__main__":
-    try:
-        logger.info("=== OIL PRICE MONITOR STARTING ===")
-        monitor = OilPriceMonitor()
-        monitor.run(interval_minutes=5)
-    except KeyboardInterrupt:
-        logger.info("Monitoring stopped by user")
-    except Exception as e:
-        logger.critical(f"Fatal system error: {e}", exc_info=True)
-        raise
\ No newline at end of file
+    import sys
+    from src.cli import main
+
+    sys.exit(main(["run"] + sys.argv[1:]))
@@ -1,14 +1,14 @@
-import requests
 import os
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 import logging
 import re
 
-load_dotenv()
+from utils.config import load_env
+
 
 class NewsAggregator:
     def __init__(self):
+        load_env()
         self.logger = logging.getLogger(__name__)
         self.api_keys = {
             'newsapi': os.getenv('NEWSAPI_API_KEY'),
@@ -83,6 +83,8 @@ class NewsAggregator:
     def _fetch_newsapi(self, num_articles):
         """NewsAPI with strict parameters"""
         try:
+            import requests
+            
             params = {
                 "q": "(crude oil OR wti OR brent) AND (price OR $ OR barrel)",
                 "domains": "reuters.com,bloomberg.com,oilprice.com,spglobal.com,rigzone.com,marketwatch.com",
@@ -106,6 +108,8 @@ class NewsAggregator:
     def _fetch_gnews(self, num_articles):
         """GNews with strict parameters"""
         try:
+            import requests
+            
             params = {
                 "q": "(oil price OR crude oil) AND ($ OR barrel OR OPEC)",
                 "lang": "en",
@@ -1,4 +1,3 @@
-import ollama
 from typing import List, Dict
 import logging
 
@@ -38,6 +37,8 @@ class OilPriceChangeAnalyzer:
         """
         
         try:
+            import ollama  # Imported lazily: only needed once an analysis runs
+            
             response = ollama.generate(
                 model=self.model_name,
                 prompt=prompt,
@@ -1,5 +1,3 @@
-import yfinance as yf
-import pandas as pd
 from datetime import datetime
 import logging
 
@@ -7,8 +5,11 @@ logger = logging.getLogger(__name__)
 
 class OilPriceTracker:
     def __init__(self):
+        import pandas as pd  # Imported lazily to keep package import cheap
+        
         self.historical_data = pd.DataFrame(columns=['timestamp', 'price', 'source'])
         self.last_source = "Not fetched yet"  # Initialize last_source
+        self.last_symbol = None
         self.symbols = {
             'WTI': 'CL=F',
             'Brent': 'BZ=F'
@@ -34,13 +35,17 @@ class OilPriceTracker:
     
     def _fetch_yfinance(self):
         """Fetch prices using yfinance"""
+        self.last_symbol = None  # Cleared so a cache fallback is not attributed to a symbol
         try:
+            import yfinance as yf
+            
             for name, symbol in self.symbols.items():
                 ticker = yf.Ticker(symbol)
                 data = ticker.history(period='1d', interval='1m')
                 
                 if not data.empty:
                     last_price = data['Close'].iloc[-1]
+                    self.last_symbol = symbol
                     return last_price, f"yfinance-{name}"
                     
         except Exception as e:
@@ -48,10 +53,38 @@ class OilPriceTracker:
             
         return None, None
     
-    def _store_price(self, price, source):
+    def fetch_history(self, period='5d', interval='5m'):
+        """Fetch historical closes as (timestamp, price, source) tuples, oldest first"""
+        try:
+            import yfinance as yf
+            
+            for name, symbol in self.symbols.items():
+                data = yf.Ticker(symbol).history(period=period, interval=interval)
+                
+                if not data.empty:
+                    source = f"yfinance-{name}"
+                    return [
+                        (self._to_local(timestamp), float(price), source)
+                        for timestamp, price in data['Close'].items()
+                    ]
+                    
+        except Exception as e:
+            logger.error(f"yfinance history error: {e}")
+            
+        return []
+    
+    @staticmethod
+    def _to_local(timestamp):
+        """Convert an exchange timestamp to naive local time, matching datetime.now()"""
+        timestamp = timestamp.to_pydatetime()
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone().replace(tzinfo=None)
+        return timestamp
+    
+    def _store_price(self, price, source, timestamp=None):
         """Store price with timestamp and source"""
         self.historical_data.loc[len(self.historical_data)] = {
-            'timestamp': datetime.now(),
+            'timestamp': timestamp or datetime.now(),
             'price': price,
             'source': source
         }
\ No newline at end of file
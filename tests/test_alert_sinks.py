@@ -0,0 +1,81 @@
+from datetime import datetime
+import json
+
+import pytest
+
+from src.alert_sinks import (
+    AlertDispatcher,
+    AlertSink,
+    FileAlertSink,
+    LogAlertSink,
+    WebhookAlertSink,
+    build_alert_sinks,
+)
+from src.anomaly_events import EPISODE_STARTED, AnomalyEpisode
+
+
+class RecordingSink(AlertSink):
+    def __init__(self):
+        self.sent = []
+
+    def send(self, event, episode):
+        self.sent.append((event, episode))
+
+
+class FailingSink(AlertSink):
+    def send(self, event, episode):
+        raise RuntimeError("webhook down")
+
+
+@pytest.fixture
+def episode():
+    episode = AnomalyEpisode(datetime(2025, 3, 3, 10, 0), 80.0, 3.2)
+    episode.id = 1
+    episode.analysis = {'reasons': ['OPEC+ cut']}
+    return episode
+
+
+def test_failing_sink_does_not_block_others(episode):
+    first, last = RecordingSink(), RecordingSink()
+    AlertDispatcher([first, FailingSink(), last]).dispatch(EPISODE_STARTED, episode)
+
+    assert first.sent == [(EPISODE_STARTED, episode)]
+    assert last.sent == [(EPISODE_STARTED, episode)]
+
+
+def test_dispatcher_defaults_to_log_sink():
+    dispatcher = AlertDispatcher()
+    assert [type(s) for s in dispatcher.sinks] == [LogAlertSink]
+
+
+def test_file_sink_appends_json_lines(tmp_path, episode):
+    path = tmp_path / "alerts" / "alerts.jsonl"
+    sink = FileAlertSink(str(path))
+    sink.send(EPISODE_STARTED, episode)
+    sink.send("ended", episode)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r['event'] for r in records] == [EPISODE_STARTED, "ended"]
+    assert records[0]['peak_z'] == 3.2
+    assert records[0]['analysis'] == {'reasons': ['OPEC+ cut']}
+
+
+def test_build_alert_sinks(monkeypatch, tmp_path):
+    monkeypatch.setenv("ALERT_FILE", str(tmp_path / "alerts.jsonl"))
+    monkeypatch.setenv("ALERT_WEBHOOK_URL", "http://localhost:9/hook")
+
+    sinks = build_alert_sinks(" log, FILE ,,webhook,unknown")
+
+    assert [type(s) for s in sinks] == [LogAlertSink, FileAlertSink, WebhookAlertSink]
+    assert sinks[1].path == str(tmp_path / "alerts.jsonl")
+    assert sinks[2].url == "http://localhost:9/hook"
+
+
+def test_build_alert_sinks_skips_webhook_without_url(monkeypatch):
+    monkeypatch.delenv("ALERT_WEBHOOK_URL", raising=False)
+    assert build_alert_sinks("webhook") == []
+
+
+def test_build_alert_sinks_reads_env(monkeypatch):
+    monkeypatch.delenv("ALERT_SINKS", raising=False)
+    assert [type(s) for s in build_alert_sinks()] == [LogAlertSink]
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+from src.anomaly_events import (
+    EPISODE_ENDED,
+    EPISODE_STARTED,
+    EPISODE_UPDATED,
+    AnomalyEpisode,
+    AnomalyEventTracker,
+)
+
+T0 = datetime(2025, 3, 3, 10, 0)
+
+
+def tick(minutes):
+    return T0 + timedelta(minutes=minutes)
+
+
+def test_episode_tracks_peak_by_absolute_z_score():
+    episode = AnomalyEpisode(T0, 80.0, 3.1)
+    episode.update(82.0, 4.0)
+    episode.update(60.0, -5.0)
+    episode.update(81.0, 3.5)
+
+    assert episode.tick_count == 4
+    assert (episode.peak_price, episode.peak_z) == (60.0, -5.0)
+    assert episode.last_price == 81.0
+    assert episode.is_open
+
+
+def test_consecutive_anomalies_form_one_episode():
+    tracker = AnomalyEventTracker(quiet_ticks=1)
+
+    assert tracker.observe(tick(0), 70.0, False, 0.2) == (None, None)
+    event, episode = tracker.observe(tick(5), 80.0, True, 3.2)
+    assert event == EPISODE_STARTED
+    assert tracker.observe(tick(10), 82.0, True, 3.8) == (EPISODE_UPDATED, episode)
+
+    event, ended = tracker.observe(tick(15), 71.0, False, 0.5)
+    assert (event, ended) == (EPISODE_ENDED, episode)
+    assert ended.ended_at == tick(15)
+    assert ended.tick_count == 2
+    assert tracker.current_episode is None
+
+
+def test_quiet_ticks_debounce_episode_end():
+    tracker = AnomalyEventTracker(quiet_ticks=3)
+    _, episode = tracker.observe(tick(0), 80.0, True, 3.2)
+
+    assert tracker.observe(tick(5), 71.0, False, 0.5) == (None, episode)
+    assert tracker.observe(tick(10), 71.0, False, 0.5) == (None, episode)
+    # An anomaly inside the quiet period resets the count
+    assert tracker.observe(tick(15), 81.0, True, 3.4) == (EPISODE_UPDATED, episode)
+    assert tracker.observe(tick(20), 71.0, False, 0.5) == (None, episode)
+    assert tracker.observe(tick(25), 71.0, False, 0.5) == (None, episode)
+    assert tracker.observe(tick(30), 71.0, False, 0.5) == (EPISODE_ENDED, episode)
+
+
+def test_enrichment_runs_once_per_episode():
+    tracker = AnomalyEventTracker(cooldown_minutes=30)
+    assert not tracker.should_enrich(tick(0))
+
+    tracker.observe(tick(0), 80.0, True, 3.2)
+    assert tracker.should_enrich(tick(0))
+    assert tracker.mark_enriched(tick(0), {'reasons': ['OPEC+ cut']})
+
+    tracker.observe(tick(60), 82.0, True, 3.8)
+    assert not tracker.should_enrich(tick(60))
+
+
+def test_cooldown_spans_episodes():
+    tracker = AnomalyEventTracker(cooldown_minutes=30, quiet_ticks=1)
+    tracker.observe(tick(0), 80.0, True, 3.2)
+    tracker.mark_enriched(tick(0), {'reasons': ['OPEC+ cut']})
+    tracker.observe(tick(5), 71.0, False, 0.5)
+
+    tracker.observe(tick(10), 60.0, True, -3.5)
+    assert not tracker.should_enrich(tick(10))
+    assert tracker.should_enrich(tick(30))
+
+
+def test_failed_analysis_is_not_kept_and_retried_after_cooldown():
+    tracker = AnomalyEventTracker(cooldown_minutes=30)
+    _, episode = tracker.observe(tick(0), 80.0, True, 3.2)
+
+    assert not tracker.mark_enriched(tick(0), {'error': 'connection refused'})
+    assert episode.analysis is None
+    assert tracker.last_enriched_at == tick(0)
+    assert not tracker.should_enrich(tick(10))
+    assert tracker.should_enrich(tick(30))
+
+    assert not tracker.mark_enriched(tick(30), None)
+    assert tracker.mark_enriched(tick(60), {'reasons': ['Hurricane']})
+    assert episode.analysis == {'reasons': ['Hurricane']}
@@ -0,0 +1,117 @@
+from datetime import datetime
+from types import SimpleNamespace
+import math
+import struct
+import time
+
+import pytest
+
+from src.anomaly_detector import AnomalyDetector
+from src.anomaly_events import AnomalyEventTracker
+from src.checkpoint import decode_state, encode_state, load_checkpoint, save_checkpoint
+from src.price_tracker import OilPriceTracker
+
+
+def make_state(window_size=5):
+    return SimpleNamespace(
+        anomaly_detector=AnomalyDetector(window_size=window_size, threshold=2),
+        price_tracker=OilPriceTracker(),
+        event_tracker=AnomalyEventTracker()
+    )
+
+
+def populated_state():
+    state = make_state()
+    for price in [70.0, 70.5, 71.0, 70.8]:
+        state.anomaly_detector.detect_anomaly(price)
+    state.price_tracker._store_price(70.8, "yfinance-WTI", datetime(2025, 1, 6, 12, 0))
+    state.price_tracker._store_price(71.2, "yfinance-WTI", datetime(2025, 7, 6, 12, 5))
+    state.price_tracker.last_source = "yfinance-WTI"
+
+    events = state.event_tracker
+    events.observe(datetime(2025, 7, 6, 12, 5), 71.2, True, 3.5)
+    events.mark_enriched(datetime(2025, 7, 6, 12, 5), {'reasons': ['OPEC+ cut']})
+    events.current_episode.id = 7
+    events.quiet_count = 1
+    return state
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    """Run under a non-UTC zone so naive/UTC confusion shows up as drift"""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_round_trip_is_stable(local_tz):
+    original = populated_state()
+    expected = list(original.price_tracker.historical_data['timestamp'])
+
+    state = original
+    for _ in range(3):  # Restored pd.Timestamp values must survive re-encoding
+        restored = make_state()
+        decode_state(encode_state(state), restored)
+        state = restored
+
+    assert list(state.anomaly_detector.price_window) == [70.0, 70.5, 71.0, 70.8]
+    assert list(state.price_tracker.historical_data['timestamp']) == expected
+    assert list(state.price_tracker.historical_data['price']) == [70.8, 71.2]
+    assert state.price_tracker.last_source == "yfinance-WTI"
+
+    episode = state.event_tracker.current_episode
+    assert episode.id == 7
+    assert episode.started_at == datetime(2025, 7, 6, 12, 5)
+    assert episode.peak_z == 3.5
+    assert episode.analysis == {'reasons': ['OPEC+ cut']}
+    assert state.event_tracker.quiet_count == 1
+    assert state.event_tracker.last_enriched_at == datetime(2025, 7, 6, 12, 5)
+
+
+def test_restore_keeps_configured_window_size():
+    restored = make_state(window_size=2)
+    decode_state(encode_state(populated_state()), restored)
+    assert list(restored.anomaly_detector.price_window) == [71.0, 70.8]
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "state.bin"
+    save_checkpoint(str(path), populated_state())
+
+    restored = make_state()
+    assert load_checkpoint(str(path), restored)
+    assert len(restored.price_tracker.historical_data) == 2
+
+
+def test_missing_checkpoint(tmp_path):
+    assert not load_checkpoint(str(tmp_path / "missing.bin"), make_state())
+
+
+def first_row_offset(data):
+    """Byte offset of the first price tracker row timestamp"""
+    window_end = 5 + 8 + 8 * struct.unpack_from("<I", data, 9)[0]
+    source_length = struct.unpack_from("<I", data, window_end)[0]
+    return window_end + 4 + source_length + 4
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-1],
+    lambda data: b"XXXX" + data[4:],
+    lambda data: b"",
+    # Out-of-range timestamps make datetime.fromtimestamp overflow
+    lambda data: data[:-8] + struct.pack("<d", 1e300),
+    lambda data: data[:first_row_offset(data)] + struct.pack("<d", math.inf)
+    + data[first_row_offset(data) + 8:],
+])
+def test_corrupt_checkpoint_is_ignored(tmp_path, corrupt):
+    path = tmp_path / "state.bin"
+    path.write_bytes(corrupt(encode_state(populated_state())))
+
+    restored = make_state()
+    assert not load_checkpoint(str(path), restored)
+    assert len(restored.anomaly_detector.price_window) == 0
+    assert restored.price_tracker.historical_data.empty
+    assert restored.event_tracker.current_episode is None
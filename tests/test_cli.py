@@ -0,0 +1,23 @@
+import pytest
+
+from src.cli import build_parser
+
+
+@pytest.mark.parametrize("argv", [
+    ["--checkpoint", "x.bin", "run"],
+    ["run", "--checkpoint", "x.bin"],
+    ["run", "--interval", "1", "--checkpoint", "x.bin"],
+])
+def test_checkpoint_before_or_after_subcommand(argv):
+    args = build_parser().parse_args(argv)
+    assert args.command == "run"
+    assert args.checkpoint == "x.bin"
+
+
+def test_checkpoint_defaults_to_none():
+    assert build_parser().parse_args(["once"]).checkpoint is None
+
+
+def test_backfill_options():
+    args = build_parser().parse_args(["backfill", "--period", "1mo", "--interval", "1h"])
+    assert (args.period, args.interval) == ("1mo", "1h")
@@ -0,0 +1,53 @@
+from datetime import datetime
+import json
+import sqlite3
+
+import pytest
+
+from src.anomaly_events import AnomalyEpisode
+from src.etl_pipeline import ETLPipeline
+
+
+@pytest.fixture
+def etl(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ETLPipeline()
+
+
+def episode_rows(etl):
+    conn = sqlite3.connect(etl.db_file)
+    try:
+        return conn.execute("""
+            SELECT id, started_at, ended_at, peak_price, peak_z, tick_count, analysis
+            FROM anomaly_episodes ORDER BY id
+        """).fetchall()
+    finally:
+        conn.close()
+
+
+def test_store_episode_inserts_then_updates(etl):
+    episode = AnomalyEpisode(datetime(2025, 3, 3, 10, 0), 80.0, 3.2)
+
+    episode_id = etl.store_episode(episode)
+    assert episode_id == episode.id == 1
+
+    episode.update(85.0, 4.1)
+    episode.analysis = {'reasons': ['OPEC+ cut']}
+    episode.close(datetime(2025, 3, 3, 10, 30))
+    assert etl.store_episode(episode) == 1
+
+    rows = episode_rows(etl)
+    assert len(rows) == 1
+    _, started_at, ended_at, peak_price, peak_z, tick_count, analysis = rows[0]
+    assert (started_at, ended_at) == ("2025-03-03 10:00:00", "2025-03-03 10:30:00")
+    assert (peak_price, peak_z, tick_count) == (85.0, 4.1, 2)
+    assert json.loads(analysis) == {'reasons': ['OPEC+ cut']}
+
+
+def test_separate_episodes_get_separate_rows(etl):
+    first = AnomalyEpisode(datetime(2025, 3, 3, 10, 0), 80.0, 3.2)
+    second = AnomalyEpisode(datetime(2025, 3, 3, 12, 0), 60.0, -3.4)
+
+    assert etl.store_episode(first) == 1
+    assert etl.store_episode(second) == 2
+    assert [row[6] for row in episode_rows(etl)] == [None, None]
@@ -0,0 +1,76 @@
+import json
+import logging
+
+import pytest
+
+from utils.logger import log_stage, setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    path = tmp_path / "logs" / "monitor.log"
+    yield path
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def read_records(path):
+    shutdown_logging()  # Stops the listener after draining the queue
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_records_are_written_as_json_with_extra_fields(log_file):
+    root = setup_logging(level="DEBUG", log_file=str(log_file))
+    assert root is logging.getLogger()
+
+    logger = logging.getLogger("src.monitor")
+    logger.info("Current Price: $%.2f", 71.5, extra={'symbol': 'CL=F', 'price': 71.5})
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.error("Monitoring cycle error", exc_info=True, extra={'symbol': 'BZ=F'})
+
+    price, error = read_records(log_file)
+    assert price['message'] == "Current Price: $71.50"
+    assert (price['symbol'], price['price'], price['levelname']) == ('CL=F', 71.5, 'INFO')
+    assert price['name'] == "src.monitor"
+
+    assert error['symbol'] == 'BZ=F'
+    assert error['levelname'] == 'ERROR'
+    assert "ZeroDivisionError" in error['exc_info']
+
+
+def test_log_stage_records_timing_and_fields(log_file):
+    setup_logging(log_file=str(log_file))
+    logger = logging.getLogger("src.monitor")
+
+    with log_stage(logger, "fetch") as fields:
+        fields['symbol'] = 'CL=F'
+    with log_stage(logger, "detect", level=logging.DEBUG):
+        pass  # Below the configured INFO level
+
+    (record,) = read_records(log_file)
+    assert record['stage'] == "fetch"
+    assert record['symbol'] == 'CL=F'
+    assert record['duration_ms'] >= 0
+
+
+def test_setup_logging_is_idempotent(log_file):
+    setup_logging(log_file=str(log_file))
+    setup_logging(log_file=str(log_file))
+    assert len(logging.getLogger().handlers) == 1
+
+
+def test_file_rotates_by_size(log_file):
+    setup_logging(log_file=str(log_file), max_bytes=500, backup_count=2)
+    logger = logging.getLogger("src.monitor")
+    for i in range(50):
+        logger.info(f"record {i}")
+    shutdown_logging()
+
+    assert log_file.exists()
+    assert (log_file.parent / "monitor.log.1").exists()
+    assert not (log_file.parent / "monitor.log.3").exists()
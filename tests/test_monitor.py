@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+import sqlite3
+
+import pytest
+
+from src.monitor import OilPriceMonitor
+
+START = datetime(2025, 3, 3, 10, 0)
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    # ETLPipeline and the checkpoint use paths relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ANOMALY_WINDOW_SIZE", "3")
+    monkeypatch.setenv("ANOMALY_THRESHOLD", "2")
+    monkeypatch.setenv("ALERT_SINKS", "log")
+    return OilPriceMonitor(checkpoint_path=str(tmp_path / "state.bin"))
+
+
+def stored_rows(monitor):
+    conn = sqlite3.connect(monitor.etl.db_file)
+    try:
+        return conn.execute(
+            "SELECT timestamp, price, is_anomaly FROM oil_prices ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def history(n):
+    return [(START + timedelta(minutes=5 * i), 70.0 + i, "yfinance-WTI") for i in range(n)]
+
+
+def test_backfill_skips_rows_at_or_before_database_cutoff(monitor, monkeypatch):
+    monkeypatch.setattr(monitor.price_tracker, "fetch_history", lambda **kwargs: history(5))
+    monitor.etl.store_data({'timestamp': START + timedelta(minutes=10), 'price': 72.0})
+
+    assert monitor.backfill() == 2
+    assert [row[1] for row in stored_rows(monitor)] == [72.0, 73.0, 74.0]
+    # Rows already stored still warm the detector
+    assert list(monitor.anomaly_detector.price_window) == [72.0, 73.0, 74.0]
+    assert list(monitor.price_tracker.historical_data['price']) == [70.0, 71.0, 72.0, 73.0, 74.0]
+
+
+def test_backfill_warms_detector_when_database_is_newer(monitor, monkeypatch, tmp_path):
+    # Upgrade path: the old monitor filled the database, but there is no checkpoint
+    monkeypatch.setattr(monitor.price_tracker, "fetch_history", lambda **kwargs: history(50))
+    monitor.etl.store_data({'timestamp': START + timedelta(days=1), 'price': 75.0})
+
+    assert monitor.backfill() == 0
+    assert len(stored_rows(monitor)) == 1
+    assert list(monitor.anomaly_detector.price_window) == [117.0, 118.0, 119.0]
+
+    restored = OilPriceMonitor(checkpoint_path=str(tmp_path / "state.bin"))
+    assert list(restored.anomaly_detector.price_window) == [117.0, 118.0, 119.0]
+
+
+def test_backfill_tops_up_partially_restored_window(monitor, monkeypatch):
+    monkeypatch.setattr(monitor.price_tracker, "fetch_history", lambda **kwargs: history(5))
+    monitor.price_tracker._store_price(99.0, "yfinance-WTI", START + timedelta(days=1))
+    monitor.anomaly_detector.price_window.append(99.0)
+
+    assert monitor.backfill() == 0
+    assert list(monitor.anomaly_detector.price_window) == [73.0, 74.0, 99.0]
+
+
+def test_backfill_uses_restored_tracker_history_as_cutoff(monitor, monkeypatch):
+    monkeypatch.setattr(monitor.price_tracker, "fetch_history", lambda **kwargs: history(5))
+    monitor.price_tracker._store_price(73.0, "yfinance-WTI", START + timedelta(minutes=15))
+
+    assert monitor.backfill() == 1
+    assert [row[1] for row in stored_rows(monitor)] == [74.0]
+
+
+def test_backfill_is_idempotent(monitor, monkeypatch):
+    monkeypatch.setattr(monitor.price_tracker, "fetch_history", lambda **kwargs: history(4))
+
+    assert monitor.backfill() == 4
+    assert monitor.backfill() == 0
+    assert len(stored_rows(monitor)) == 4
+
+
+def test_rescore_only_updates_flipped_rows(monitor, monkeypatch):
+    prices = [70.0, 70.5, 70.0, 70.5, 90.0, 70.2]
+    flags = [False, False, True, False, False, False]  # Row 3 wrong, row 5 missed
+    for i, (price, flag) in enumerate(zip(prices, flags)):
+        monitor.etl.store_data({'timestamp': START + timedelta(minutes=i), 'price': price}, flag)
+
+    updates = []
+    update_anomaly_flags = monitor.etl.update_anomaly_flags
+
+    def spy(changed):
+        updates.append(list(changed))
+        update_anomaly_flags(changed)
+
+    monkeypatch.setattr(monitor.etl, "update_anomaly_flags", spy)
+
+    assert monitor.rescore() == (6, 2)
+    assert updates == [[(False, 3), (True, 5)]]
+    assert [row[2] for row in stored_rows(monitor)] == [0, 0, 0, 0, 1, 0]
+
+
+def test_rescore_without_changes_writes_nothing(monitor, monkeypatch):
+    for i, price in enumerate([70.0, 70.5, 70.0, 70.5]):
+        monitor.etl.store_data({'timestamp': START + timedelta(minutes=i), 'price': price})
+    monkeypatch.setattr(
+        monitor.etl, "update_anomaly_flags",
+        lambda changed: pytest.fail("no rows should be rewritten")
+    )
+
+    assert monitor.rescore() == (4, 0)
+
+
+def test_run_cycle_retries_failed_analysis_and_stores_json(monitor, monkeypatch):
+    monitor.event_tracker.cooldown = timedelta(0)
+    monkeypatch.setattr(monitor.price_tracker, "fetch_live_price", lambda: 90.0)
+    monkeypatch.setattr(monitor.anomaly_detector, "detect_anomaly", lambda price: (True, 3.5))
+    monkeypatch.setattr(
+        monitor.news_aggregator, "fetch_price_change_reasons", lambda: [{'title': 'x'}]
+    )
+    results = iter([{'error': 'ollama unavailable'}, {'reasons': ['OPEC+ cut']}])
+    monkeypatch.setattr(monitor.analyzer, "analyze_price_change", lambda articles: next(results))
+
+    assert monitor.run_cycle()
+    assert monitor.event_tracker.current_episode.analysis is None
+    assert monitor.run_cycle()
+
+    conn = sqlite3.connect(monitor.etl.db_file)
+    try:
+        price_analyses = [row[0] for row in conn.execute("SELECT analysis FROM oil_prices ORDER BY id")]
+        (episode_analysis,) = conn.execute("SELECT analysis FROM anomaly_episodes").fetchone()
+    finally:
+        conn.close()
+    assert price_analyses == [None, '{"reasons": ["OPEC+ cut"]}']
+    assert episode_analysis == '{"reasons": ["OPEC+ cut"]}'
@@ -0,0 +1,26 @@
+import sys
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.price_tracker import OilPriceTracker
+
+
+def fake_yfinance(close):
+    """Stand-in yfinance module whose tickers return one close, or no data"""
+    def ticker(symbol):
+        data = pd.DataFrame({'Close': [close]} if close is not None else {'Close': []})
+        return SimpleNamespace(history=lambda **kwargs: data)
+    return SimpleNamespace(Ticker=ticker)
+
+
+def test_cache_fallback_clears_last_symbol(monkeypatch):
+    tracker = OilPriceTracker()
+
+    monkeypatch.setitem(sys.modules, "yfinance", fake_yfinance(71.5))
+    assert tracker.fetch_live_price() == 71.5
+    assert (tracker.last_symbol, tracker.last_source) == ("CL=F", "yfinance-WTI")
+
+    monkeypatch.setitem(sys.modules, "yfinance", fake_yfinance(None))
+    assert tracker.fetch_live_price() == 71.5
+    assert (tracker.last_symbol, tracker.last_source) == (None, "Cache")
@@ -1,8 +1,11 @@
-from dotenv import load_dotenv
-import os
-load_dotenv
-print("DEBUG: Current working directory:", os.getcwd())
-print("DEBUG: Files in directory:", os.listdir())
-load_dotenv()  # Add this line before accessing env vars
+_env_loaded = False
 
-print("DEBUG: ALPHAVANTAGE_API_KEY exists?", "ALPHAVANTAGE_API_KEY" in os.environ)
\ No newline at end of file
+
+def load_env():
+    """Load variables from .env once; later calls are no-ops"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
@@ -1,14 +1,119 @@
-from utils.logger import setup_logging
-
-class OilPriceMonitor:
-    def __init__(self):
-        self.logger = setup_logging()
-        
-    def run(self):
-        try:
-            self.logger.info("Starting oil price monitoring")
-            # Main logic here
-        except Exception as e:
-            self.logger.error(f"Monitoring failed: {str(e)}", exc_info=True)
-            raise
-        
\ No newline at end of file
+"""
+Structured, non-blocking logging for the oil price monitor.
+
+Records are put on an in-memory queue by the calling thread and written by a
+background QueueListener as JSON lines to a size-rotated file (and stderr), so
+slow disks or terminals never stall a monitoring cycle.
+"""
+from contextlib import contextmanager
+import atexit
+import copy
+import logging
+import logging.handlers
+import os
+import queue
+import time
+
+JSON_FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s"
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener = None
+
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps extra fields and leaves formatting to the listener"""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            # Tracebacks cannot cross the queue, so render them here
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(level=None, log_file=None, max_bytes=None, backup_count=None, json_console=None):
+    """
+    Configure root logging once and return the root logger
+
+    Parameters (default to LOG_* environment variables):
+    - level: Log level name, LOG_LEVEL (INFO)
+    - log_file: JSON log file path, LOG_FILE (oil_monitor.log)
+    - max_bytes: Rotate the file at this size, LOG_MAX_BYTES (10 MB)
+    - backup_count: Rotated files to keep, LOG_BACKUP_COUNT (5)
+    - json_console: Emit JSON on stderr too, LOG_JSON_CONSOLE (false)
+    """
+    global _listener
+    if _listener is not None:
+        return logging.getLogger()
+
+    from pythonjsonlogger import jsonlogger
+
+    level = level or os.getenv('LOG_LEVEL', 'INFO')
+    log_file = log_file or os.getenv('LOG_FILE', 'oil_monitor.log')
+    max_bytes = max_bytes or int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024))
+    backup_count = backup_count if backup_count is not None else int(os.getenv('LOG_BACKUP_COUNT', 5))
+    if json_console is None:
+        json_console = os.getenv('LOG_JSON_CONSOLE', 'false').lower() in ('1', 'true', 'yes')
+
+    json_formatter = jsonlogger.JsonFormatter(JSON_FORMAT)
+
+    log_dir = os.path.dirname(log_file)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    file_handler.setFormatter(json_formatter)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(json_formatter if json_console else logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_StructuredQueueHandler(log_queue))
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    return root
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+@contextmanager
+def log_stage(logger, stage, level=logging.INFO, **fields):
+    """
+    Time a block and log it with stage and duration_ms fields
+
+    The yielded dict can be updated inside the block to attach more fields,
+    e.g. the symbol that was fetched.
+    """
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                f"Stage {stage} took {duration_ms:.1f} ms",
+                extra={'stage': stage, 'duration_ms': round(duration_ms, 2), **fields}
+            )